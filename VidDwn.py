@@ -2,25 +2,121 @@ import sys
 import os
 import re
 import webbrowser
-import json
 import shutil
 import platform
 import subprocess
+import copy
+import json
 import logging
+import sqlite3
+import threading
+import time
 import urllib.request
 import zipfile
-import tarfile
 from PyQt5 import QtCore, QtGui, QtWidgets
-from yt_dlp import YoutubeDL, utils
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, filename='downloader.log',
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
 
-def is_ffmpeg_installed():
-    """Check if FFmpeg is already installed and accessible."""
-    return shutil.which("ffmpeg") is not None
+# Resolved once at startup so the FFmpeg installer can stream archives through the C extractor.
+TAR_PATH = shutil.which("tar")
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# yt-dlp pulls in hundreds of extractor modules, so YtDlpImporter loads it after the window is up
+YoutubeDL = None
+utils = None
+
+
+def _stream_extract(url, extract_dir, system):
+    """
+    Stream an FFmpeg archive straight from the network into the system tar binary.
+
+    Returns:
+        bool: True if the archive was extracted, False if no streaming extractor is available.
+    """
+    if url.endswith(".tar.xz") and TAR_PATH:
+        command = [TAR_PATH, "-xJf", "-", "-C", extract_dir]
+    elif url.endswith(".zip") and TAR_PATH and system in ("windows", "darwin"):
+        # Windows 10+ and macOS ship bsdtar, which can read zip archives from stdin
+        command = [TAR_PATH, "-xf", "-", "-C", extract_dir]
+    else:
+        return False
+
+    with urllib.request.urlopen(url) as response:
+        process = subprocess.Popen(command, stdin=subprocess.PIPE)
+        try:
+            while chunk := response.read(DOWNLOAD_CHUNK_SIZE):
+                process.stdin.write(chunk)
+        except BrokenPipeError:
+            # tar exited early; its exit status below says why
+            pass
+        finally:
+            try:
+                process.stdin.close()
+            except BrokenPipeError:
+                pass
+            returncode = process.wait()
+
+    if returncode != 0:
+        raise RuntimeError(f"tar exited with status {returncode}")
+    return True
+
+
+def _extract_zip(archive_path, extract_dir):
+    """Extract a zip archive member by member with a buffer sized to each file."""
+    root = os.path.realpath(extract_dir)
+    with zipfile.ZipFile(archive_path) as zip_ref:
+        for info in zip_ref.infolist():
+            target = os.path.realpath(os.path.join(extract_dir, info.filename))
+            if os.path.commonpath([root, target]) != root:
+                raise ValueError(f"Unsafe path in archive: {info.filename}")
+            if info.is_dir():
+                os.makedirs(target, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            if info.file_size == 0:
+                open(target, "wb").close()
+                continue
+            with zip_ref.open(info) as src, open(target, "wb",
+                                                 buffering=min(info.file_size, DOWNLOAD_CHUNK_SIZE)) as dst:
+                shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+
+
+def _download_and_extract(url, extract_dir):
+    """Download a zip FFmpeg archive to disk and extract it with the standard library."""
+    if not url.endswith(".zip"):
+        raise ValueError(f"Unsupported archive format: {url}")
+    # Zip keeps its index at the end of the file, so it has to be downloaded first
+    ffmpeg_archive = os.path.join(extract_dir, "ffmpeg_download")
+    urllib.request.urlretrieve(url, ffmpeg_archive)
+    logging.info(f"Downloaded FFmpeg from {url} to {ffmpeg_archive}")
+    _extract_zip(ffmpeg_archive, extract_dir)
+
+
+def _find_ffmpeg(root):
+    """
+    Search an extracted FFmpeg archive for the ffmpeg executable.
+
+    Documentation and preset folders are skipped, and the search stops at the first match.
+
+    Returns:
+        str: Path to the executable, or None if it was not found.
+    """
+    targets = {"ffmpeg", "ffmpeg.exe"}
+    skipped_dirs = {"doc", "presets", "model", "man", "share"}
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in skipped_dirs:
+                        stack.append(entry.path)
+                elif entry.name in targets and entry.is_file():
+                    return entry.path
+    return None
 
 
 def download_and_install_ffmpeg():
@@ -45,39 +141,35 @@ def download_and_install_ffmpeg():
         print("Unsupported operating system for FFmpeg installation.")  # Inform the user.
         return False # Added Return
 
+    # Python's tarfile/lzma is far slower than the tar binary, so POSIX installs require it
+    if system != "windows" and not TAR_PATH:
+        logging.error("The 'tar' command is required to install FFmpeg but was not found.")
+        print("The 'tar' command is required to install FFmpeg but was not found.")
+        return False
+
     # Create a temporary directory for FFmpeg
     if not os.path.exists(extract_dir):
         os.makedirs(extract_dir)
 
-    ffmpeg_archive = os.path.join(extract_dir, "ffmpeg_download")
-
     try:
-        # Download FFmpeg
+        # Download and extract FFmpeg
         print(f"Downloading FFmpeg from {ffmpeg_url}...")
         logging.info(f"Downloading FFmpeg from {ffmpeg_url}")
         try:
-            urllib.request.urlretrieve(ffmpeg_url, ffmpeg_archive)
+            try:
+                streamed = _stream_extract(ffmpeg_url, extract_dir, system)
+            except RuntimeError as e:
+                if not ffmpeg_url.endswith(".zip"):
+                    raise
+                # The tar on PATH may be GNU tar (e.g. from Git for Windows), which cannot read zip
+                logging.warning(f"Streaming zip extraction failed ({e}); falling back to zipfile")
+                streamed = False
+            if not streamed:
+                _download_and_extract(ffmpeg_url, extract_dir)
         except urllib.error.URLError as e:
             print(f"Error downloading FFmpeg: {e}")
             logging.error(f"Error downloading FFmpeg: {e}")
             return False
-        print("Download complete.")
-        logging.info(f"Downloaded FFmpeg from {ffmpeg_url} to {ffmpeg_archive}")
-
-        # Extract the archive
-        print("Extracting FFmpeg...")
-        logging.info("Extracting FFmpeg archive")
-        try:
-            if ffmpeg_url.endswith(".zip"):
-                with zipfile.ZipFile(ffmpeg_archive, "r") as zip_ref:
-                    zip_ref.extractall(extract_dir)
-            elif ffmpeg_url.endswith(".tar.xz"):
-                with tarfile.open(ffmpeg_archive, "r:xz") as tar_ref:
-                    tar_ref.extractall(extract_dir)
-            else:
-              logging.error(f"Unsupported archive format: {ffmpeg_url}")
-              print(f"Unsupported archive format: {ffmpeg_url}")
-              return False
         except Exception as e:
             print(f"Error extracting FFmpeg archive: {e}")
             logging.error(f"Error extracting FFmpeg archive: {e}")
@@ -88,14 +180,7 @@ def download_and_install_ffmpeg():
         # Locate the ffmpeg executable
         print("Locating FFmpeg executable...")
         logging.info("Locating FFmpeg executable")
-        ffmpeg_path = None
-        for root, dirs, files in os.walk(extract_dir):
-            for file in files:
-                if file == "ffmpeg" or file == "ffmpeg.exe":
-                    ffmpeg_path = os.path.join(root, file)
-                    break
-            if ffmpeg_path:
-                break
+        ffmpeg_path = _find_ffmpeg(extract_dir)
 
         if not ffmpeg_path:
             print("Failed to locate FFmpeg executable after extraction.")
@@ -110,10 +195,7 @@ def download_and_install_ffmpeg():
         logging.info("FFmpeg added to PATH temporarily.")
 
         # Temporary Install: Keep the ffmpeg files.
-        # Cleanup downloaded archive and extracted files
-        # os.remove(ffmpeg_archive)
-        # logging.info(f"Removed FFmpeg archive: {ffmpeg_archive}")
-
+        # Cleanup extracted files
         # shutil.rmtree(extract_dir)
         # logging.info(f"Removed temporary extraction directory: {extract_dir}")
 
@@ -127,26 +209,59 @@ def download_and_install_ffmpeg():
         return False
 
 
+class YtDlpImporter(QtCore.QThread):
+    """Import yt-dlp off the GUI thread so the window appears without waiting for it."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.error = None
+
+    def run(self):
+        global YoutubeDL, utils
+        try:
+            from yt_dlp import YoutubeDL, utils
+        except Exception as e:
+            self.error = e
+            logging.error(f"Failed to import yt-dlp: {str(e)}")
+
+
 class GradientWidget(QtWidgets.QWidget):
-    def paintEvent(self, event):
-        painter = QtGui.QPainter(self)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # The gradient covers the whole widget, so Qt does not need to erase it first
+        self.setAttribute(QtCore.Qt.WA_OpaquePaintEvent, True)
+        self._gradient = self._build_gradient()
+
+    def _build_gradient(self):
         # X-like dark gradient with blue accents
         gradient = QtGui.QLinearGradient(0, 0, self.width(), self.height())
         gradient.setColorAt(0, QtGui.QColor("#14171A"))  # Dark background color
         gradient.setColorAt(1, QtGui.QColor("#1DA1F2"))  # X/Twitter blue
-        painter.fillRect(self.rect(), gradient)
+        return gradient
+
+    def resizeEvent(self, event):
+        # The gradient only depends on the widget size, so rebuild it here rather than on every paint
+        self._gradient = self._build_gradient()
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        painter.fillRect(self.rect(), self._gradient)
 
 
 class YouTubeDownloader(QtWidgets.QMainWindow):
-    SUPPORTED_PLATFORMS = {
-        'youtube.com': 'YouTube',
-        'youtu.be': 'YouTube',
-        'twitter.com': 'X (Twitter)',
-        'x.com': 'X (Twitter)',
-        'fb.watch': 'Facebook',
-        'facebook.com': 'Facebook',
+    # Domain suffixes (with a leading dot) mapped to platform names, matched against the URL host
+    SUPPORTED_PLATFORMS = (
+        ('.youtube.com', 'YouTube'),
+        ('.youtu.be', 'YouTube'),
+        ('.twitter.com', 'X (Twitter)'),
+        ('.x.com', 'X (Twitter)'),
+        ('.fb.watch', 'Facebook'),
+        ('.facebook.com', 'Facebook'),
         # Add more supported platforms here
-    }
+    )
+
+    URL_DOMAIN_PATTERN = re.compile(r'^(?:https?://)?([^:/\s]+)', re.ASCII)
 
     QUALITY_OPTIONS = [
         "Best Available (Default)",
@@ -158,6 +273,15 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
         "4K"
     ]
 
+    # yt-dlp format selectors for quality options; the defaults keep the export format's selector
+    QUALITY_FORMATS = {
+        "Best Video Only": "bestvideo/best",
+        "Best Audio Only": "bestaudio/best",
+        "720p": "bv*[height<=720]+ba/b[height<=720]",
+        "1080p": "bv*[height<=1080]+ba/b[height<=1080]",
+        "4K": "bv*[height<=2160]+ba/b[height<=2160]",
+    }
+
     FORMAT_OPTIONS = [
         "mp4",
         "mp3",
@@ -165,7 +289,105 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
         "mov"
     ]
 
-    HISTORY_FILE = "download_history.json"
+    # yt-dlp options for each export format
+    FORMAT_YDL_OPTS = {
+        'mp3': {
+            'format': 'bestaudio/best',
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'mp3',
+                'preferredquality': '192',
+            }],
+        },
+        'wav': {
+            'format': 'bestaudio/best',
+            'postprocessors': [{
+                'key': 'FFmpegExtractAudio',
+                'preferredcodec': 'wav',
+                'preferredquality': '192',
+            }],
+        },
+        'mov': {
+            'format': 'bestvideo+bestaudio/best',
+            'postprocessors': [{
+                'key': 'FFmpegVideoConvertor',
+                'preferedformat': 'mov',
+            }],
+        },
+        'mp4': {
+            'format': 'bestvideo+bestaudio/best',
+            # Single-stream selections come back as m4a/webm/mkv, so remux them to mp4 too
+            'merge_output_format': 'mp4',
+            'postprocessors': [{
+                'key': 'FFmpegVideoRemuxer',
+                'preferedformat': 'mp4',
+            }],
+        },
+    }
+
+    HISTORY_DB = "history.db"
+    LEGACY_HISTORY_FILE = "download_history.json"
+
+    MAX_PARALLEL_DOWNLOADS = 8
+
+    # Common Styles
+    LABEL_STYLE = "color: white;"
+    INPUT_STYLE = """
+        background-color: #1E2631;
+        color: white;
+        border: 2px solid #1DA1F2;
+        border-radius: 5px;
+        padding: 5px;
+    """
+    BUTTON_STYLE = """
+        background-color: #1DA1F2;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 20px;
+    """
+    CANCEL_BUTTON_STYLE = """
+        background-color: #FF4D4D;
+        color: white;
+        border: none;
+        border-radius: 5px;
+        padding: 8px 20px;
+    """
+    DROPDOWN_STYLE = """
+        background-color: #1E2631;
+        color: white;
+        border: 2px solid #1DA1F2;
+        border-radius: 5px;
+        padding: 5px;
+    """
+    PROGRESS_BAR_STYLE = """
+        QProgressBar {
+            background-color: #1E2631;
+            color: white;
+            border: 2px solid #1DA1F2;
+            border-radius: 5px;
+            text-align: center;
+        }
+        QProgressBar::chunk {
+            background-color: #1DA1F2;
+            width: 20px;
+        }
+    """
+    HISTORY_LIST_STYLE = """
+        QListWidget {
+            background-color: #1E2631;
+            color: white;
+            border: 2px solid #1DA1F2;
+            border-radius: 5px;
+        }
+        QListWidget::item {
+            padding: 5px;
+        }
+        QListWidget::item:selected {
+            background-color: #1DA1F2;
+            color: black;
+        }
+    """
 
     def __init__(self):
         super().__init__()
@@ -177,12 +399,32 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
         self.gradient = GradientWidget()
         self.setCentralWidget(self.gradient)
 
+        # Fonts shared by every widget, built once instead of per setFont call
+        self._font12 = QtGui.QFont("Segoe UI", 12)
+        self._font10 = QtGui.QFont("Segoe UI", 10)
+        self._font_title = QtGui.QFont("Segoe UI", 16, QtGui.QFont.Bold)
+        self._font_italic = QtGui.QFont("Segoe UI", 10)
+        self._font_italic.setItalic(True)
+
         # Set up UI elements
         self.setup_ui()
 
+        # Load yt-dlp in the background; start_download waits for it
+        self._yt_dlp_importer = YtDlpImporter(self)
+        self._yt_dlp_importer.start()
+
         self.downloader = None
-        self.thread = None
-        self.worker = None
+        self.pool = QtCore.QThreadPool.globalInstance()
+        self.workers = {}  # Active downloads keyed by worker id
+        self._progress = {}  # Last reported percentage per worker id
+        self._succeeded = set()  # Worker ids whose download completed in this batch
+        self._next_worker_id = 0
+        self._failed_downloads = 0
+        self._batch_size = 0
+        self._canceled = False
+        self._ffmpeg_path = None
+        self._aria2c_path = None
+        self.db = None
 
         # Load download history
         self.load_history()
@@ -190,43 +432,21 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
         # Check and install FFmpeg if necessary
         self.check_ffmpeg()
 
+    def closeEvent(self, event):
+        # Qt aborts if a QThread is destroyed while running, so let the yt-dlp import finish
+        self._yt_dlp_importer.wait()
+        super().closeEvent(event)
+
     def check_ffmpeg(self):
-        if not is_ffmpeg_installed():
+        # Resolve FFmpeg once; PATH lookups are repeated stat calls on every directory
+        self._ffmpeg_path = shutil.which("ffmpeg")
+        # aria2c is optional; when present it downloads over several connections at once
+        self._aria2c_path = shutil.which("aria2c")
+        if not self._ffmpeg_path:
             self.prompt_ffmpeg_installation()
 
 
     def setup_ui(self):
-        # Common Styles
-        label_style = "color: white;"
-        input_style = """
-            background-color: #1E2631;
-            color: white;
-            border: 2px solid #1DA1F2;
-            border-radius: 5px;
-            padding: 5px;
-        """
-        button_style = """
-            background-color: #1DA1F2;
-            color: white;
-            border: none;
-            border-radius: 5px;
-            padding: 8px 20px;
-        """
-        cancel_button_style = """
-            background-color: #FF4D4D;
-            color: white;
-            border: none;
-            border-radius: 5px;
-            padding: 8px 20px;
-        """
-        dropdown_style = """
-            background-color: #1E2631;
-            color: white;
-            border: 2px solid #1DA1F2;
-            border-radius: 5px;
-            padding: 5px;
-        """
-
         # Central layout
         main_layout = QtWidgets.QVBoxLayout(self.centralWidget())
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -234,8 +454,8 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
 
         # Title Label
         self.title_label = QtWidgets.QLabel("Video Downloader - FREE", self)
-        self.title_label.setFont(QtGui.QFont("Segoe UI", 16, QtGui.QFont.Bold))
-        self.title_label.setStyleSheet("color: white;")
+        self.title_label.setFont(self._font_title)
+        self.title_label.setStyleSheet(self.LABEL_STYLE)
         self.title_label.setAlignment(QtCore.Qt.AlignCenter)
         main_layout.addWidget(self.title_label)
 
@@ -244,8 +464,8 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
         self.clickable_label.setText(
             '<i><a href="https://x.com/lukekabbash" style="color: white; text-decoration: none;"><span style="border-bottom: 1px solid blue;">@LukeKabbash on X</span></a></i>'
         )
-        self.clickable_label.setFont(QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic))
-        self.clickable_label.setStyleSheet("color: white;")
+        self.clickable_label.setFont(self._font_italic)
+        self.clickable_label.setStyleSheet(self.LABEL_STYLE)
         self.clickable_label.setAlignment(QtCore.Qt.AlignRight)
         self.clickable_label.setTextFormat(QtCore.Qt.RichText)
         self.clickable_label.setTextInteractionFlags(QtCore.Qt.TextBrowserInteraction)
@@ -257,20 +477,21 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
 
         # URL Label and Input
         self.url_label = QtWidgets.QLabel("Video URL:", self)
-        self.url_label.setFont(QtGui.QFont("Segoe UI", 12))
-        self.url_label.setStyleSheet(label_style)
+        self.url_label.setFont(self._font12)
+        self.url_label.setStyleSheet(self.LABEL_STYLE)
         self.url_input = QtWidgets.QLineEdit(self)
-        self.url_input.setFont(QtGui.QFont("Segoe UI", 12))
-        self.url_input.setStyleSheet(input_style)
+        self.url_input.setFont(self._font12)
+        self.url_input.setStyleSheet(self.INPUT_STYLE)
+        self.url_input.setPlaceholderText("Separate multiple URLs with spaces")
         form_layout.addRow(self.url_label, self.url_input)
 
         # Directory Label, Display, and Browse Button
         self.dir_label = QtWidgets.QLabel("Save to:", self)
-        self.dir_label.setFont(QtGui.QFont("Segoe UI", 12))
-        self.dir_label.setStyleSheet(label_style)
+        self.dir_label.setFont(self._font12)
+        self.dir_label.setStyleSheet(self.LABEL_STYLE)
         self.dir_display = QtWidgets.QLineEdit(self)
-        self.dir_display.setFont(QtGui.QFont("Segoe UI", 12))
-        self.dir_display.setStyleSheet(input_style)
+        self.dir_display.setFont(self._font12)
+        self.dir_display.setStyleSheet(self.INPUT_STYLE)
         self.dir_display.setReadOnly(True)
         # Set default directory to system's Downloads folder
         self.default_download_dir = os.path.join(os.path.expanduser('~'), 'Downloads')
@@ -286,8 +507,8 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
                 self.dir_display.setText("")
         
         self.browse_button = QtWidgets.QPushButton("Browse", self)
-        self.browse_button.setFont(QtGui.QFont("Segoe UI", 12))
-        self.browse_button.setStyleSheet(button_style)
+        self.browse_button.setFont(self._font12)
+        self.browse_button.setStyleSheet(self.BUTTON_STYLE)
         self.browse_button.clicked.connect(self.browse_directory)
         
         dir_hbox = QtWidgets.QHBoxLayout()
@@ -297,32 +518,40 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
 
         # Quality/Type Selection Label
         self.quality_type_label = QtWidgets.QLabel("Quality/Type:", self)
-        self.quality_type_label.setFont(QtGui.QFont("Segoe UI", 12))
-        self.quality_type_label.setStyleSheet(label_style)
+        self.quality_type_label.setFont(self._font12)
+        self.quality_type_label.setStyleSheet(self.LABEL_STYLE)
         
         # Quality Dropdown
         self.quality_dropdown = QtWidgets.QComboBox(self)
-        self.quality_dropdown.setFont(QtGui.QFont("Segoe UI", 12))
-        self.quality_dropdown.setStyleSheet(dropdown_style)
+        self.quality_dropdown.setFont(self._font12)
+        self.quality_dropdown.setStyleSheet(self.DROPDOWN_STYLE)
         self.quality_dropdown.addItems(self.QUALITY_OPTIONS)
 
         # Export Format Dropdown
         self.format_dropdown = QtWidgets.QComboBox(self)
-        self.format_dropdown.setFont(QtGui.QFont("Segoe UI", 12))
-        self.format_dropdown.setStyleSheet(dropdown_style)
+        self.format_dropdown.setFont(self._font12)
+        self.format_dropdown.setStyleSheet(self.DROPDOWN_STYLE)
         self.format_dropdown.addItems(self.FORMAT_OPTIONS)
         self.format_dropdown.setCurrentText("mp4")
         self.format_dropdown.setToolTip("Select export format (.mp4 is default)")
+
+        # Parallel Downloads Selector
+        self.parallel_spinbox = QtWidgets.QSpinBox(self)
+        self.parallel_spinbox.setFont(self._font12)
+        self.parallel_spinbox.setStyleSheet(self.DROPDOWN_STYLE)
+        self.parallel_spinbox.setRange(1, self.MAX_PARALLEL_DOWNLOADS)
+        self.parallel_spinbox.setValue(min(4, os.cpu_count() or 1))
+        self.parallel_spinbox.setToolTip("Number of simultaneous downloads")
         
         # Download and Cancel Buttons
         self.download_button = QtWidgets.QPushButton("Download", self)
-        self.download_button.setFont(QtGui.QFont("Segoe UI", 12))
-        self.download_button.setStyleSheet(button_style)
+        self.download_button.setFont(self._font12)
+        self.download_button.setStyleSheet(self.BUTTON_STYLE)
         self.download_button.clicked.connect(self.start_download)
 
         self.cancel_button = QtWidgets.QPushButton("Cancel", self)
-        self.cancel_button.setFont(QtGui.QFont("Segoe UI", 12))
-        self.cancel_button.setStyleSheet(cancel_button_style)
+        self.cancel_button.setFont(self._font12)
+        self.cancel_button.setStyleSheet(self.CANCEL_BUTTON_STYLE)
         self.cancel_button.clicked.connect(self.cancel_download)
         self.cancel_button.setEnabled(False)
 
@@ -330,6 +559,7 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
         button_hbox = QtWidgets.QHBoxLayout()
         button_hbox.addWidget(self.quality_dropdown)
         button_hbox.addWidget(self.format_dropdown)
+        button_hbox.addWidget(self.parallel_spinbox)
         button_hbox.addStretch()
         button_hbox.addWidget(self.download_button)
         button_hbox.addWidget(self.cancel_button)
@@ -341,31 +571,20 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
         # Progress Bar
         self.progress_bar = QtWidgets.QProgressBar(self)
         self.progress_bar.setGeometry(50, 230, 700, 30) # Revert progress bar size.
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                background-color: #1E2631;
-                color: white;
-                border: 2px solid #1DA1F2;
-                border-radius: 5px;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #1DA1F2;
-                width: 20px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(self.PROGRESS_BAR_STYLE)
+
         self.progress_bar.setValue(0)
         main_layout.addWidget(self.progress_bar)
 
         # Status Label
         self.status_label = QtWidgets.QLabel("Idle", self)
-        self.status_label.setFont(QtGui.QFont("Segoe UI", 12))
-        self.status_label.setStyleSheet("color: white;")
+        self.status_label.setFont(self._font12)
+        self.status_label.setStyleSheet(self.LABEL_STYLE)
         main_layout.addWidget(self.status_label)
 
         # Supported Platforms Label
         self.supported_label = QtWidgets.QLabel("Supported Platforms: YouTube, X (Twitter), Facebook", self)
-        self.supported_label.setFont(QtGui.QFont("Segoe UI", 10))
+        self.supported_label.setFont(self._font10)
         self.supported_label.setStyleSheet("color: #1DA1F2;")
         main_layout.addWidget(self.supported_label)
         
@@ -374,14 +593,14 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
         
         # Download History Label
         self.history_label = QtWidgets.QLabel("Download History:", self)
-        self.history_label.setFont(QtGui.QFont("Segoe UI", 12))
-        self.history_label.setStyleSheet(label_style)
+        self.history_label.setFont(self._font12)
+        self.history_label.setStyleSheet(self.LABEL_STYLE)
         history_layout.addWidget(self.history_label)
         
         # Delete Selected File Button
         self.delete_button = QtWidgets.QPushButton("Delete File", self)
-        self.delete_button.setFont(QtGui.QFont("Segoe UI", 12))
-        self.delete_button.setStyleSheet(cancel_button_style)
+        self.delete_button.setFont(self._font12)
+        self.delete_button.setStyleSheet(self.CANCEL_BUTTON_STYLE)
         self.delete_button.clicked.connect(self.delete_selected_file)
         self.delete_button.setFixedWidth(160)
 
@@ -394,22 +613,10 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
 
         # Download History List Widget
         self.history_list = QtWidgets.QListWidget(self)
-        self.history_list.setFont(QtGui.QFont("Segoe UI", 10))
-        self.history_list.setStyleSheet("""
-            QListWidget {
-                background-color: #1E2631;
-                color: white;
-                border: 2px solid #1DA1F2;
-                border-radius: 5px;
-            }
-            QListWidget::item {
-                padding: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #1DA1F2;
-                color: black;
-            }
-        """)
+        self.history_list.setFont(self._font10)
+        self.history_list.setStyleSheet(self.HISTORY_LIST_STYLE)
+        self.history_list.setUniformItemSizes(True)  # Every row is one line of text
+
         self.history_list.itemDoubleClicked.connect(self.open_file_location)
         history_layout.addWidget(self.history_list)
         
@@ -431,6 +638,7 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
         if response == QtWidgets.QMessageBox.Yes:
             success = download_and_install_ffmpeg()
             if success:
+                self._ffmpeg_path = shutil.which("ffmpeg")
                 QtWidgets.QMessageBox.information(
                     self, "FFmpeg Installed",
                     "FFmpeg has been installed temporarily and added to the current session's PATH."
@@ -449,22 +657,76 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
             sys.exit(1)
 
     def load_history(self):
-        if os.path.exists(self.HISTORY_FILE):
+        try:
+            # Autocommit mode: every history change is a single statement
+            self.db = sqlite3.connect(self.HISTORY_DB, isolation_level=None)
+            self.db.execute("PRAGMA journal_mode=WAL")
+            self.db.execute("CREATE TABLE IF NOT EXISTS downloads("
+                            "path TEXT PRIMARY KEY, ts INTEGER, size INTEGER)")
+            # A broken legacy file must not keep the database rows from loading
             try:
-                with open(self.HISTORY_FILE, 'r') as f:
-                    history = json.load(f)
-                    for filepath in history:
-                        self.history_list.addItem(filepath)
+                self.migrate_legacy_history()
             except Exception as e:
-                QtWidgets.QMessageBox.warning(self, "History Load Error",
-                                              f"Failed to load download history: {str(e)}")
-                logging.error(f"Failed to load download history: {str(e)}")
+                logging.error(f"Failed to migrate {self.LEGACY_HISTORY_FILE}, leaving it in place: {str(e)}")
+            history = [filepath for (filepath,) in self.db.execute("SELECT path FROM downloads ORDER BY ts, rowid")]
+            # Insert every row in one batch so the list lays out and repaints once
+            self.history_list.setUpdatesEnabled(False)
+            self.history_list.blockSignals(True)
+            try:
+                self.history_list.addItems(history)
+            finally:
+                self.history_list.blockSignals(False)
+                self.history_list.setUpdatesEnabled(True)
+        except Exception as e:
+            QtWidgets.QMessageBox.warning(self, "History Load Error",
+                                          f"Failed to load download history: {str(e)}")
+            logging.error(f"Failed to load download history: {str(e)}")
 
-    def save_history(self):
-        history = [self.history_list.item(i).text() for i in range(self.history_list.count())]
+    def migrate_legacy_history(self):
+        """Import the JSON history written by earlier versions into the history database, once."""
+        if not os.path.exists(self.LEGACY_HISTORY_FILE):
+            return
+        with open(self.LEGACY_HISTORY_FILE, 'r') as f:
+            history = json.load(f)
+        ts = int(os.path.getmtime(self.LEGACY_HISTORY_FILE))
+        rows = [(filepath, ts, os.path.getsize(filepath) if os.path.exists(filepath) else None)
+                for filepath in history]
+        # One transaction for the whole import instead of an autocommit per row
+        self.db.execute("BEGIN")
         try:
-            with open(self.HISTORY_FILE, 'w') as f:
-                json.dump(history, f, indent=4)
+            self.db.executemany("INSERT OR IGNORE INTO downloads(path, ts, size) VALUES (?, ?, ?)", rows)
+            self.db.execute("COMMIT")
+        except Exception:
+            self.db.execute("ROLLBACK")
+            raise
+        os.replace(self.LEGACY_HISTORY_FILE, self.LEGACY_HISTORY_FILE + ".migrated")
+        logging.info(f"Migrated {len(rows)} entries from {self.LEGACY_HISTORY_FILE} to {self.HISTORY_DB}")
+
+    def save_history_entry(self, filepath):
+        if self.db is None:
+            return
+        try:
+            size = os.path.getsize(filepath) if os.path.exists(filepath) else None
+            self.db.execute("INSERT OR REPLACE INTO downloads(path, ts, size) VALUES (?, ?, ?)",
+                            (filepath, int(time.time()), size))
+        except Exception as e:
+            QtWidgets.QMessageBox.warning(self, "History Save Error",
+                                          f"Failed to save download history: {str(e)}")
+            logging.error(f"Failed to save download history: {str(e)}")
+
+    def delete_history_entries(self, filepaths):
+        if self.db is None or not filepaths:
+            return
+        try:
+            # One transaction for the whole selection instead of an autocommit per row
+            self.db.execute("BEGIN")
+            try:
+                self.db.executemany("DELETE FROM downloads WHERE path = ?",
+                                    [(filepath,) for filepath in filepaths])
+                self.db.execute("COMMIT")
+            except Exception:
+                self.db.execute("ROLLBACK")
+                raise
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, "History Save Error",
                                           f"Failed to save download history: {str(e)}")
@@ -477,189 +739,191 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
 
     def validate_url(self, url):
         # Simple regex to extract domain
-        pattern = r'^(?:http[s]?://)?([^:/\s]+)'
-        match = re.match(pattern, url)
+        match = self.URL_DOMAIN_PATTERN.match(url)
         if match:
             domain = match.group(1).lower()
-            for key in self.SUPPORTED_PLATFORMS:
-                if key in domain:
-                    return self.SUPPORTED_PLATFORMS[key]
+            for suffix, platform_name in self.SUPPORTED_PLATFORMS:
+                if domain.endswith(suffix) or domain == suffix[1:]:
+                    return platform_name
         return None
 
-    def get_format_option(self):
-        selected_format = self.format_dropdown.currentText()
-        if selected_format == 'mp3':
-            return 'mp3'
-        elif selected_format == 'wav':
-            return 'wav'
-        elif selected_format == 'mov':
-            return 'mov'
-        else:
-            return 'mp4'
-
     def start_download(self):
-        url = self.url_input.text().strip()
+        # Drop repeated URLs; two workers on one URL would write the same output file
+        urls = list(dict.fromkeys(self.url_input.text().split()))
         directory = self.dir_display.text().strip()
-        export_format = self.get_format_option()
         selected_quality = self.quality_dropdown.currentText()
 
-        if not url:
+        if not urls:
             QtWidgets.QMessageBox.warning(self, "Input Error", "Please enter a video URL.")
             return
         if not directory:
             QtWidgets.QMessageBox.warning(self, "Input Error", "Please select a download directory.")
             return
 
-        platform_name = self.validate_url(url)
-        if not platform_name:
-            QtWidgets.QMessageBox.warning(self, "Unsupported URL",
-                                          "The provided URL is either unsupported or invalid.")
-            return
-
-        # Extract video info to determine expected filename
-        try:
-            ydl_opts_info = {
-                'quiet': True,
-                'skip_download': True,
-            }
-            with YoutubeDL(ydl_opts_info) as ydl:
-                info = ydl.extract_info(url, download=False)
-                title = info.get('title', 'downloaded_video')
-                if export_format in ['mp3', 'wav']:
-                    ext = export_format
-                elif export_format == 'mov':
-                    ext = 'mov'
-                else:
-                    ext = 'mp4'
-                # Sanitize the title to create a valid filename
-                filename = re.sub(r'[\\/*?:"<>|]', "", title)
-                expected_filepath = os.path.join(directory, f"{filename}.{ext}")
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Error", f"Failed to retrieve video information: {str(e)}")
-            logging.error(f"Failed to retrieve video information: {str(e)}")
-            return
-
-        # Check if the file already exists
-        if os.path.exists(expected_filepath):
-            response = QtWidgets.QMessageBox.question(
-                self, "File Exists",
-                f"The file '{os.path.basename(expected_filepath)}' already exists.\n"
-                "Do you want to overwrite it?",
-                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
-            )
-            if response == QtWidgets.QMessageBox.No:
-                QtWidgets.QMessageBox.information(self, "Download Skipped",
-                                                  "The download has been skipped.")
+        platform_names = [self.validate_url(url) for url in urls]
+        for url, platform_name in zip(urls, platform_names):
+            if not platform_name:
+                QtWidgets.QMessageBox.warning(self, "Unsupported URL",
+                                              f"The provided URL is either unsupported or invalid:\n{url}")
                 return
-            else:
-                try:
-                    os.remove(expected_filepath)
-                    logging.info(f"Existing file '{expected_filepath}' removed for overwrite.")
-                except Exception as e:
-                    QtWidgets.QMessageBox.critical(self, "Error",
-                                                   f"Failed to remove existing file: {str(e)}")
-                    logging.error(f"Failed to remove existing file '{expected_filepath}': {str(e)}")
-                    return
 
-        self.download_button.setEnabled(False)
-        self.cancel_button.setEnabled(True)
-        self.delete_button.setEnabled(False)  # Disable delete button during download
-        self.status_label.setText(f"Starting download from {platform_name}...")
-        self.progress_bar.setValue(0)
+        # Make sure the background import of yt-dlp has finished
+        self._yt_dlp_importer.wait()
+        if YoutubeDL is None:
+            QtWidgets.QMessageBox.critical(self, "Error",
+                                           f"Failed to load yt-dlp: {str(self._yt_dlp_importer.error)}")
+            return
 
         # Configure yt-dlp options based on export format
         ydl_opts = {
             'outtmpl': os.path.join(directory, '%(title)s.%(ext)s'),
             'quiet': True,
             'noprogress': True,
-            'ffmpeg_location': shutil.which("ffmpeg")  # Explicitly specify FFmpeg location
+            'concurrent_fragment_downloads': 8,  # Fetch HLS/DASH fragments in parallel
+            'http_chunk_size': 10 * 1024 * 1024,  # Fetch in 10 MiB ranged requests; helps against throttling
+            'ffmpeg_location': self._ffmpeg_path  # Explicitly specify FFmpeg location
         }
 
-        format_choice = self.get_format_option()
-        if format_choice == 'mp3':
-            ydl_opts['format'] = 'bestaudio/best'
-            ydl_opts['postprocessors'] = [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            }]
-        elif format_choice == 'wav':
-            ydl_opts['format'] = 'bestaudio/best'
-            ydl_opts['postprocessors'] = [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'wav',
-                'preferredquality': '192',
-            }]
-        elif format_choice == 'mov':
-            ydl_opts['format'] = 'bestvideo+bestaudio/best'
-            ydl_opts['postprocessors'] = [{
-                'key': 'FFmpegVideoConvertor',
-                'preferedformat': 'mov',
-            }]
-        else:  # mp4
-            ydl_opts['format'] = 'bestvideo+bestaudio/best'
-            # No postprocessor needed for mp4
-
-        # Run the download in a separate thread to keep UI responsive
-        self.thread = QtCore.QThread()
-        self.worker = DownloadWorker(YoutubeDL(ydl_opts), url, format_choice, expected_filepath)
-        self.worker.moveToThread(self.thread)
-        self.thread.started.connect(self.worker.run)
-        self.worker.progress.connect(self.update_progress)
-        self.worker.error.connect(self.handle_error)
-        self.worker.finished.connect(self.download_finished)
-        self.worker.download_complete.connect(self.add_to_history)
-        self.thread.start()
+        format_choice = self.format_dropdown.currentText()
+        ydl_opts.update(self.FORMAT_YDL_OPTS[format_choice])
+        quality_format = self.QUALITY_FORMATS.get(selected_quality)
+        # Audio exports always start from the best audio stream
+        if quality_format and format_choice not in ('mp3', 'wav'):
+            ydl_opts['format'] = quality_format
+        ydl_opts['final_ext'] = format_choice
+
+        if self._aria2c_path:
+            # yt-dlp already runs aria2c with 16 connections and 1 MiB splits
+            ydl_opts['external_downloader'] = 'aria2c'
+
+        jobs = list(zip(urls, platform_names))
+
+        self.download_button.setEnabled(False)
+        self.cancel_button.setEnabled(True)
+        self.delete_button.setEnabled(False)  # Disable delete button during download
+        if len(jobs) == 1:
+            self.status_label.setText(f"Starting download from {jobs[0][1]}...")
+        else:
+            self.status_label.setText(f"Starting {len(jobs)} downloads...")
+        self.progress_bar.setValue(0)
+        self.progress_bar.setTextVisible(False)  # The status label already shows the percentage
+        self._failed_downloads = 0
+        self._batch_size = len(jobs)
+        self._succeeded.clear()
+        self._canceled = False
+
+        # Run the downloads on the thread pool to keep UI responsive
+        self.pool.setMaxThreadCount(self.parallel_spinbox.value())
+        for url, _ in jobs:
+            worker_id = self._next_worker_id
+            self._next_worker_id += 1
+            # yt-dlp is not thread-safe and YoutubeDL keeps and mutates its params dict,
+            # so every worker builds its own instance from its own copy of the options
+            worker = DownloadWorker(worker_id, copy.deepcopy(ydl_opts), url, format_choice)
+            worker.signals.file_exists.connect(self.confirm_overwrite)
+            worker.signals.progress.connect(self.update_progress)
+            worker.signals.error.connect(self.handle_error)
+            worker.signals.finished.connect(self.download_finished)
+            worker.signals.download_complete.connect(self.add_to_history)
+            self.workers[worker_id] = worker
+            self._progress[worker_id] = 0
+            self.pool.start(worker)
 
     def cancel_download(self):
-        if self.worker and self.worker.downloader:
-            self.worker.downloader.process_interrupt()
-            self.status_label.setText("Download canceled.")
-            self.download_button.setEnabled(True)
+        if self.workers and not self._canceled:
+            self._canceled = True
+            for worker in self.workers.values():
+                worker.cancel()
+            # Workers stop at their next progress report; download_finished resets the UI once
+            # the last one has actually stopped. aria2c only reports when a file is complete.
+            if self._aria2c_path:
+                self.status_label.setText("Canceling... waiting for aria2c to stop.")
+            else:
+                self.status_label.setText("Canceling...")
             self.cancel_button.setEnabled(False)
-            self.delete_button.setEnabled(True)  # Re-enable delete button after cancellation
             logging.info("Download canceled by user.")
-            if self.thread:
-                self.thread.quit()
-                self.thread.wait()
 
-    @QtCore.pyqtSlot(int)
-    def update_progress(self, percent):
-        self.progress_bar.setValue(percent)
-        self.status_label.setText(f"Downloading... {percent}%")
+    @QtCore.pyqtSlot(int, str)
+    def confirm_overwrite(self, worker_id, filepath):
+        worker = self.workers.get(worker_id)
+        if worker is None or worker.cancelled:
+            return
+        response = QtWidgets.QMessageBox.question(
+            self, "File Exists",
+            f"The file '{os.path.basename(filepath)}' already exists.\n"
+            "Do you want to overwrite it?",
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No
+        )
+        if response == QtWidgets.QMessageBox.No:
+            QtWidgets.QMessageBox.information(self, "Download Skipped",
+                                              "The download has been skipped.")
+        worker.answer_overwrite(response == QtWidgets.QMessageBox.Yes)
+
+    @QtCore.pyqtSlot(int, int)
+    def update_progress(self, worker_id, percent):
+        if self._canceled or worker_id not in self._progress:
+            return
+        self._progress[worker_id] = percent
+        # Overall progress is the mean over every download started in this batch
+        overall = sum(self._progress.values()) // len(self._progress)
+        self.progress_bar.setValue(overall)
+        if len(self._progress) == 1:
+            self.status_label.setText(f"Downloading... {overall}%")
+        else:
+            self.status_label.setText(f"Downloading {len(self._progress)} videos... {overall}%")
 
-    @QtCore.pyqtSlot(str)
-    def handle_error(self, error_message):
+    @QtCore.pyqtSlot(int, str)
+    def handle_error(self, worker_id, error_message):
+        if worker_id not in self.workers or self._canceled:
+            return
+        self._failed_downloads += 1
         QtWidgets.QMessageBox.critical(self, "Download Error", error_message)
         self.status_label.setText("Download failed.")
-        self.download_button.setEnabled(True)
-        self.cancel_button.setEnabled(False)
-        self.delete_button.setEnabled(True)  # Re-enable delete button after error
         logging.error(f"Download error: {error_message}")
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
 
-    @QtCore.pyqtSlot(str)
-    def add_to_history(self, filepath):
-        # Add the downloaded file path to the history list
+    @QtCore.pyqtSlot(int, str)
+    def add_to_history(self, worker_id, filepath):
+        if worker_id not in self.workers or self._canceled:
+            return
+        self._succeeded.add(worker_id)
+        self._progress[worker_id] = 100
+        # Add the downloaded file path to the history list, replacing an earlier entry for
+        # the same path like the INSERT OR REPLACE in save_history_entry does
+        for existing in self.history_list.findItems(filepath, QtCore.Qt.MatchExactly):
+            self.history_list.takeItem(self.history_list.row(existing))
         self.history_list.addItem(filepath)
-        self.save_history()
+        self.save_history_entry(filepath)
         logging.info(f"Download completed: {filepath}")
-        self.download_button.setEnabled(True)
-        self.cancel_button.setEnabled(False)
-        self.delete_button.setEnabled(True)
-        self.status_label.setText("Download finished.")
 
-    def download_finished(self):
-        self.status_label.setText("Download finished.")
+    @QtCore.pyqtSlot(int)
+    def download_finished(self, worker_id):
+        if self.workers.pop(worker_id, None) is None:
+            return
+        logging.info(f"Download worker {worker_id} finished.")
+        # Skipped and failed downloads never reach 100%, so stop counting them toward the mean
+        if worker_id not in self._succeeded:
+            self._progress.pop(worker_id, None)
+        if self.workers:
+            if self._progress:
+                self.progress_bar.setValue(sum(self._progress.values()) // len(self._progress))
+            return
+
+        # Every download in the batch is done
+        self._progress.clear()
+        self.progress_bar.setValue(100 if self._succeeded and not self._canceled else 0)
+        # Progress updates from other workers overwrite the per-error text, so summarize here
+        if self._canceled:
+            self.status_label.setText("Download canceled.")
+        elif not self._failed_downloads:
+            self.status_label.setText("Download finished.")
+        elif self._batch_size == 1:
+            self.status_label.setText("Download failed.")
+        else:
+            self.status_label.setText(f"{self._failed_downloads} of {self._batch_size} downloads failed.")
         self.download_button.setEnabled(True)
         self.cancel_button.setEnabled(False)
+        self.progress_bar.setTextVisible(True)
         self.delete_button.setEnabled(True)
-        logging.info("Download thread finished.")
-        if self.thread:
-            self.thread.quit()
-            self.thread.wait()
 
 
     def open_file_location(self, item):
@@ -688,67 +952,153 @@ class YouTubeDownloader(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "No Selection", "Please select a file to delete.")
             return
 
+        deleted = []
         for item in selected_items:
             filepath = item.text()
-            if os.path.exists(filepath):
-                try:
-                    os.remove(filepath)
-                    logging.info(f"Deleted file: {filepath}")
-                    self.history_list.takeItem(self.history_list.row(item))
-                    self.save_history()
-                except Exception as e:
-                    QtWidgets.QMessageBox.critical(self, "Deletion Error",
-                                                   f"Failed to delete '{os.path.basename(filepath)}': {str(e)}")
-                    logging.error(f"Failed to delete '{filepath}': {str(e)}")
-            else:
+            # Attempt the removal directly; a separate existence check would cost another syscall
+            try:
+                os.remove(filepath)
+                logging.info(f"Deleted file: {filepath}")
+                self.history_list.takeItem(self.history_list.row(item))
+                deleted.append(filepath)
+            except FileNotFoundError:
                 QtWidgets.QMessageBox.warning(self, "File Not Found",
                                               f"The file does not exist:\n{filepath}")
                 logging.warning(f"File not found for deletion: {filepath}")
+            except OSError as e:
+                QtWidgets.QMessageBox.critical(self, "Deletion Error",
+                                               f"Failed to delete '{os.path.basename(filepath)}': {str(e)}")
+                logging.error(f"Failed to delete '{filepath}': {str(e)}")
+
+        # Update the stored history once for the whole selection
+        self.delete_history_entries(deleted)
+
 
+class DownloadSignals(QtCore.QObject):
+    # QRunnable is not a QObject, so the worker's signals live here
+    file_exists = QtCore.pyqtSignal(int, str)  # worker id, filepath; answered with answer_overwrite
+    progress = QtCore.pyqtSignal(int, int)  # worker id, percent
+    error = QtCore.pyqtSignal(int, str)
+    finished = QtCore.pyqtSignal(int)
+    download_complete = QtCore.pyqtSignal(int, str)  # Signal to emit worker id and filepath
 
-class DownloadWorker(QtCore.QObject):
-    progress = QtCore.pyqtSignal(int)
-    error = QtCore.pyqtSignal(str)
-    finished = QtCore.pyqtSignal()
-    download_complete = QtCore.pyqtSignal(str)  # Signal to emit filepath
 
-    def __init__(self, downloader, url, format_choice, final_filepath):
+class DownloadWorker(QtCore.QRunnable):
+    PROGRESS_INTERVAL = 1 / 30  # Seconds between progress signals
+
+    def __init__(self, worker_id, ydl_opts, url, format_choice):
         super().__init__()
-        self.downloader = downloader
+        self.signals = DownloadSignals()
+        self.worker_id = worker_id
+        self.ydl_opts = ydl_opts
         self.url = url
         self.format_choice = format_choice
-        self.final_filepath = final_filepath # Store expected filepath.
+        self.downloader = None
+        self.final_filepath = None
+        self.cancelled = False
+        self._touched_files = set()  # Files the downloader has reported writing
+        self._overwrite = False
+        self._overwrite_answered = threading.Event()
+        self._last_emit_ts = 0.0
+
+    def cancel(self):
+        # Checked by the progress hook, which aborts the download from inside yt-dlp
+        self.cancelled = True
+        self._overwrite_answered.set()
+
+    def answer_overwrite(self, overwrite):
+        self._overwrite = overwrite
+        self._overwrite_answered.set()
+
+    def _remove_partial_files(self):
+        # A canceled merge can leave finished per-format files (Title.fNNN.ext) behind,
+        # along with .part files and aria2c's .aria2 control files
+        for path in self._touched_files:
+            for candidate in (path, path + ".aria2", path + ".ytdl"):
+                try:
+                    os.remove(candidate)
+                    logging.info(f"Removed partial download file: {candidate}")
+                except FileNotFoundError:
+                    pass
+                except OSError as e:
+                    logging.error(f"Failed to remove partial download file '{candidate}': {str(e)}")
 
     def run(self):
         try:
             # Define a progress hook to emit signals
             def progress_hook(d):
+                self._touched_files.update(
+                    path for path in (d.get('filename'), d.get('tmpfilename')) if path)
+                if self.cancelled:
+                    raise utils.DownloadCancelled()
                 if d['status'] == 'downloading':
-                    percent_str = d.get('_percent_str', '0.0%').strip('%')
-                    try:
-                        percent = int(float(percent_str))
-                    except ValueError:
-                        percent = 0
-                    self.progress.emit(percent)
+                    total = d.get('total_bytes') or d.get('total_bytes_estimate')
+                    if not total:
+                        return
+                    percent = min(int(d.get('downloaded_bytes', 0) * 100 // total), 100)
+                    # The hook fires for every chunk; only cross the thread boundary a few times per second
+                    now = time.monotonic()
+                    if percent == 100 or now - self._last_emit_ts >= self.PROGRESS_INTERVAL:
+                        self._last_emit_ts = now
+                        self.signals.progress.emit(self.worker_id, percent)
                 elif d['status'] == 'finished':
-                    # Instead of d.get('filepath') or d.get('filename'), we emit the final filepath
-                    # We are now emitting the final file path, and not the raw video/audio files.
-                    self.download_complete.emit(self.final_filepath)
+                    # External downloaders such as aria2c only report this final status
+                    self.signals.progress.emit(self.worker_id, 100)
 
+            # Canceled while still queued in the pool
+            if self.cancelled:
+                return
 
+            # Extract video info with the same YoutubeDL instance that will run the download,
+            # so the expected filename comes from yt-dlp's own output template and sanitizer
+            self.downloader = YoutubeDL(self.ydl_opts)
             self.downloader.add_progress_hook(progress_hook)
-            self.downloader.download([self.url])
+            try:
+                info = self.downloader.extract_info(self.url, download=False)
+            except Exception as e:
+                self.signals.error.emit(self.worker_id, f"Failed to retrieve video information: {str(e)}")
+                logging.error(f"Failed to retrieve video information for '{self.url}': {str(e)}")
+                return
+            self.final_filepath = f"{os.path.splitext(self.downloader.prepare_filename(info))[0]}.{self.format_choice}"
+
+            # Check if the file already exists; the GUI thread asks the user and answers
+            if os.path.exists(self.final_filepath):
+                self.signals.file_exists.emit(self.worker_id, self.final_filepath)
+                self._overwrite_answered.wait()
+                if self.cancelled or not self._overwrite:
+                    return
+                try:
+                    os.remove(self.final_filepath)
+                    logging.info(f"Existing file '{self.final_filepath}' removed for overwrite.")
+                except Exception as e:
+                    self.signals.error.emit(self.worker_id, f"Failed to remove existing file: {str(e)}")
+                    logging.error(f"Failed to remove existing file '{self.final_filepath}': {str(e)}")
+                    return
+
+            if self.cancelled:
+                return
+            self.downloader.process_ie_result(info, download=True)
+            # Emit the final file path once post-processing is done, not the raw video/audio files
+            self.signals.download_complete.emit(self.worker_id, self.final_filepath)
+        except utils.DownloadCancelled:
+            logging.info(f"Download worker {self.worker_id} canceled.")
+            self._remove_partial_files()
         except utils.DownloadError as de:
-            self.error.emit(f"Download failed: {str(de)}")
+            self.signals.error.emit(self.worker_id, f"Download failed: {str(de)}")
             logging.error(f"Download failed: {str(de)}")
         except Exception as e:
-            self.error.emit(f"An unexpected error occurred: {str(e)}")
+            self.signals.error.emit(self.worker_id, f"An unexpected error occurred: {str(e)}")
             logging.error(f"Unexpected error: {str(e)}")
         finally:
-            # Ensure the thread is cleaned up in all cases
-            self.finished.emit()
+            # Ensure the batch bookkeeping is updated in all cases
+            self.signals.finished.emit(self.worker_id)
 
 def main():
+    # Application attributes only take effect when set before the QApplication is created
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_UseHighDpiPixmaps)
+    QtCore.QCoreApplication.setAttribute(QtCore.Qt.AA_ShareOpenGLContexts)
+
     # Initialize the application to handle FFmpeg installation prompts
     app = QtWidgets.QApplication(sys.argv)
 